@@ -6,6 +6,7 @@ from enum import Enum
 from typing import Dict, List, Optional
 
 import boto3
+import jsii
 from aws_cdk import aws_secretsmanager as secretsmanager
 from aws_cdk import aws_ssm as ssm
 from aws_cdk import core
@@ -30,6 +31,17 @@ class InstanceMarketType(Enum):
     SPOT = 'SPOT'
 
 
+@jsii.implements(core.IStringProducer)
+class _ConfigurationJsonProducer:
+    def __init__(self, configuration: 'ClusterConfiguration') -> None:
+        self._configuration = configuration
+
+    def produce(self, context: core.IResolveContext) -> str:
+        # Produced whenever the value is resolved, not on every configuration update,
+        # so the stored configuration includes every change made before synthesis
+        return json.dumps(self._configuration.to_json(), separators=(',', ':'))
+
+
 class ClusterConfiguration(BaseConstruct):
 
     def __init__(self, scope: core.Construct, id: str, *,
@@ -123,7 +135,7 @@ class ClusterConfiguration(BaseConstruct):
         self._ssm_parameter = ssm.CfnParameter(
             self, 'SSMParameter',
             type='String',
-            value=json.dumps(self.to_json()),
+            value=core.Lazy.string_value(_ConfigurationJsonProducer(self)),
             tier='Intelligent-Tiering',
             name=f'{SSM_PARAMETER_PREFIX}/{namespace}/{configuration_name}')
 
@@ -174,7 +186,6 @@ class ClusterConfiguration(BaseConstruct):
     def update_config(self, new_config: dict = None):
         if new_config is not None:
             self._config = new_config
-        self._ssm_parameter.value = json.dumps(self.to_json())
 
     @staticmethod
     def _get_applications(applications: Optional[List[str]]) -> List[dict]:
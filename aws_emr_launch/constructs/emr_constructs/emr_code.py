@@ -1,44 +1,61 @@
 import enum
 import glob
+import hashlib
 import os
-from abc import abstractmethod
 from typing import Any, Dict, List, Optional
 
 from aws_cdk import aws_s3 as s3
 from aws_cdk import aws_s3_deployment as s3_deployment
 from aws_cdk import core
 
+try:
+    from typing import Protocol, runtime_checkable
+except ImportError:  # Python < 3.8
+    from typing_extensions import Protocol, runtime_checkable
 
-class StepFailureAction(enum.Enum):
+
+class StepFailureAction(str, enum.Enum):
     TERMINATE_JOB_FLOW = 'TERMINATE_JOB_FLOW'
     TERMINATE_CLUSTER = 'TERMINATE_CLUSTER'
     CANCEL_AND_WAIT = 'CANCEL_AND_WAIT'
     CONTINUE = 'CONTINUE'
 
 
-class Resolvable:
-    @abstractmethod
+@runtime_checkable
+class Resolvable(Protocol):
+    __slots__ = ()
+
     def resolve(self, scope: core.Construct) -> Dict[str, Any]:
         ...
 
 
 class EMRCode(Resolvable):
+    __slots__ = ('_deployment_props', '_deployment_props_dict', '_deployment_bucket', '_deployment_prefix', '_id',
+                 '_stack_deployment_id', '_bucket_deployments', '_s3_path')
+
     def __init__(self, *, deployment_props: s3_deployment.BucketDeploymentProps, id: Optional[str] = None):
         self._deployment_props = deployment_props
+        # Convert BucketDeploymentProps to dict
+        self._deployment_props_dict = vars(deployment_props)['_values']
         self._deployment_bucket = deployment_props.destination_bucket
         self._deployment_prefix = deployment_props.destination_key_prefix
         self._id = id
-        self._bucket_deployment = None
+        # Set by Code.from_path, the BucketDeployment is then shared through the Stack's construct tree
+        self._stack_deployment_id = None
+        self._bucket_deployments = {}
+        self._s3_path = None
 
     def resolve(self, scope: core.Construct) -> Dict[str, Any]:
-        # If the same deployment is used multiple times, retain only the first instantiation
-        if self._bucket_deployment is None:
-            # Convert BucketDeploymentProps to dict
-            deployment_props = vars(self._deployment_props)['_values']
-            self._bucket_deployment = s3_deployment.BucketDeployment(
+        stack = core.Stack.of(scope)
+        if self._stack_deployment_id is not None:
+            if stack.node.try_find_child(self._stack_deployment_id) is None:
+                s3_deployment.BucketDeployment(stack, self._stack_deployment_id, **self._deployment_props_dict)
+        # If the same deployment is used multiple times in a Stack, retain only the first instantiation
+        elif stack not in self._bucket_deployments:
+            self._bucket_deployments[stack] = s3_deployment.BucketDeployment(
                 scope,
                 f'{self._id}_BucketDeployment' if self._id else 'BucketDeployment',
-                **deployment_props)
+                **self._deployment_props_dict)
 
         return {'S3Path': self.s3_path}
 
@@ -52,18 +69,29 @@ class EMRCode(Resolvable):
 
     @property
     def s3_path(self) -> str:
-        return os.path.join(f's3://{self._deployment_bucket.bucket_name}', self._deployment_prefix)
+        # bucket_name is a jsii property (usually a Token), so the path is only built once
+        if self._s3_path is None:
+            self._s3_path = os.path.join(f's3://{self._deployment_bucket.bucket_name}', self._deployment_prefix)
+        return self._s3_path
 
 
 class Code:
     @staticmethod
     def from_path(path: str, deployment_bucket: s3.Bucket,
                   deployment_prefix: str, id: Optional[str] = None) -> EMRCode:
-        return EMRCode(id=id, deployment_props=s3_deployment.BucketDeploymentProps(
+        code = EMRCode(id=id, deployment_props=s3_deployment.BucketDeploymentProps(
             sources=[s3_deployment.Source.asset(path)],
             destination_bucket=deployment_bucket,
             destination_key_prefix=deployment_prefix))
 
+        # Repeated calls with the same arguments share a single BucketDeployment per Stack. The path is
+        # normalized relative to the working directory so the construct id doesn't depend on the checkout location
+        key_path = os.path.relpath(os.path.abspath(path))
+        digest = hashlib.sha256(
+            f'{id}:{key_path}:{deployment_bucket.node.path}:{deployment_prefix}'.encode('utf-8')).hexdigest()[:16]
+        code._stack_deployment_id = f'{id}_BucketDeployment_{digest}' if id else f'BucketDeployment_{digest}'
+        return code
+
     @staticmethod
     def from_props(deployment_props: s3_deployment.BucketDeploymentProps, id: Optional[str] = None):
         return EMRCode(id=id, deployment_props=deployment_props)
@@ -76,22 +104,26 @@ class Code:
 
 
 class EMRBootstrapAction(Resolvable):
+    __slots__ = ('_name', '_path', '_args', '_code', '_script_bootstrap_action')
+
     def __init__(self, name: str, path: str, args: Optional[List[str]] = None, code: Optional[EMRCode] = None):
         self._name = name
         self._path = path
-        self._args = args
+        self._args = args if args is not None else []
         self._code = code
+        self._script_bootstrap_action = {
+            'Path': self._path,
+            'Args': self._args
+        }
 
     def resolve(self, scope: core.Construct) -> Dict[str, Any]:
         if self._code is not None:
             self._code.resolve(scope)
 
+        # Copied so callers can modify the resolved action without affecting this one
         return {
             'Name': self._name,
-            'ScriptBootstrapAction': {
-                'Path': self._path,
-                'Args': self._args if self._args else []
-            }
+            'ScriptBootstrapAction': dict(self._script_bootstrap_action)
         }
 
     @property
@@ -103,7 +135,7 @@ class EMRBootstrapAction(Resolvable):
         return self._path
 
     @property
-    def args(self) -> Optional[List[str]]:
+    def args(self) -> List[str]:
         return self._args
 
     @property
@@ -112,30 +144,31 @@ class EMRBootstrapAction(Resolvable):
 
 
 class EMRStep(Resolvable):
+    __slots__ = ('_name', '_args', '_action_on_failure', '_code', '_hadoop_jar_step')
+
     def __init__(self, name: str, jar: str, main_class: Optional[str] = None, args: Optional[List[str]] = None,
                  action_on_failure: StepFailureAction = StepFailureAction.CONTINUE,
                  properties: Optional[Dict[str, str]] = None, code: Optional[EMRCode] = None):
         self._name = name
-        self._jar = jar
-        self._main_class = main_class
-        self._args = args
+        self._args = args if args is not None else []
         self._action_on_failure = action_on_failure
-        self._properties = properties
         self._code = code
+        self._hadoop_jar_step = {
+            'Jar': jar,
+            'MainClass': main_class,
+            'Args': self._args,
+            'Properties': [{'Key': k, 'Value': v} for k, v in properties.items()] if properties else []
+        }
 
     def resolve(self, scope: core.Construct) -> Dict[str, Any]:
         if self._code is not None:
             self._code.resolve(scope)
 
+        # Copied so callers can modify the resolved step, e.g. to override its Args
         return {
             'Name': self._name,
-            'ActionOnFailure': self._action_on_failure.name,
-            'HadoopJarStep': {
-                'Jar': self._jar,
-                'MainClass': self._main_class,
-                'Args': self._args if self._args else [],
-                'Properties': [{'Key': k, 'Value': v} for k, v in self._properties.items()] if self._properties else []
-            }
+            'ActionOnFailure': self._action_on_failure,
+            'HadoopJarStep': dict(self._hadoop_jar_step)
         }
 
     @property
@@ -143,5 +176,5 @@ class EMRStep(Resolvable):
         return self._name
 
     @property
-    def args(self) -> Optional[List[str]]:
+    def args(self) -> List[str]:
         return self._args
@@ -1,7 +1,12 @@
 import os
 
+from aws_cdk import aws_lambda
+
 LAMBDA_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../lambda_sources/'))
 
+# The EMRConfigUtils layer packages are installed for this runtime, see README
+LAMBDA_RUNTIME = aws_lambda.Runtime.PYTHON_3_7
+
 
 def _lambda_path(path):
     return os.path.join(LAMBDA_DIR, path)
@@ -0,0 +1,146 @@
+import atexit
+import compileall
+import functools
+import hashlib
+import os
+import py_compile
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Optional, Tuple
+
+from aws_cdk import aws_lambda, core
+from logzero import logger
+
+from aws_emr_launch.constructs.lambdas import LAMBDA_RUNTIME
+
+# Bytecode precompilation is opt-in, e.g. `cdk synth -c emr-launch:precompileLambdas=true`
+PRECOMPILE_CONTEXT_KEY = 'emr-launch:precompileLambdas'
+
+# Where Lambda extracts function code, compiled into the bytecode so tracebacks show runtime paths
+FUNCTION_INSTALL_DIR = '/var/task'
+LAYER_INSTALL_DIR = '/opt'
+
+_IGNORE_PATTERNS = ('__pycache__', '*.pyc')
+
+
+def _local_runtime_name() -> str:
+    return f'python{sys.version_info.major}.{sys.version_info.minor}'
+
+
+@functools.lru_cache(maxsize=None)
+def _docker_available() -> bool:
+    # The docker CLI can be installed without a reachable daemon
+    if shutil.which('docker') is None:
+        return False
+    try:
+        return subprocess.run(['docker', 'version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                              timeout=30).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def _precompile_enabled(scope: core.Construct) -> bool:
+    return str(scope.node.try_get_context(PRECOMPILE_CONTEXT_KEY)).lower() == 'true'
+
+
+def _compile_local(source_path: str, output_dir: str, install_dir: str, sourceless: bool) -> None:
+    for name in os.listdir(source_path):
+        source = os.path.join(source_path, name)
+        target = os.path.join(output_dir, name)
+        if os.path.isdir(source):
+            if name != '__pycache__':
+                shutil.copytree(source, target, ignore=shutil.ignore_patterns(*_IGNORE_PATTERNS))
+        elif not name.endswith('.pyc'):
+            shutil.copy2(source, target)
+
+    if sourceless:
+        compileall.compile_dir(output_dir, ddir=install_dir, quiet=1, legacy=True)
+        for dir_path, _, file_names in os.walk(output_dir):
+            for file_name in file_names:
+                file_path = os.path.join(dir_path, file_name)
+                # Modules that failed to compile keep their sources
+                if file_name.endswith('.py') and os.path.exists(f'{file_path}c'):
+                    os.remove(file_path)
+    else:
+        # Asset zips have normalized timestamps, so the bytecode must not be validated against the sources
+        compileall.compile_dir(output_dir, ddir=install_dir, quiet=1,
+                               invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+
+
+def _compile_docker(source_path: str, output_dir: str, image: str, install_dir: str, sourceless: bool) -> bool:
+    if sourceless:
+        compile_command = f'python -m compileall -q -b -d {install_dir} /asset-output;' \
+                          ' find /asset-output -name "*.py" -exec test -e {}c \\; -delete'
+    else:
+        compile_command = f'python -m compileall -q -d {install_dir} --invalidation-mode unchecked-hash' \
+                          ' /asset-output'
+
+    command = [
+        'docker', 'run', '--rm',
+        '-u', f'{os.getuid()}:{os.getgid()}',
+        '-v', f'{source_path}:/asset-input:delegated',
+        '-v', f'{output_dir}:/asset-output:delegated',
+        '-w', '/asset-input',
+        image,
+        'bash', '-c',
+        'cp -R /asset-input/. /asset-output'
+        ' && find /asset-output -name __pycache__ -type d -prune -exec rm -rf {} +'
+        ' && find /asset-output -name "*.pyc" -type f -delete'
+        f' && {compile_command}'
+    ]
+    return subprocess.run(command, stdout=subprocess.DEVNULL).returncode == 0
+
+
+@functools.lru_cache(maxsize=None)
+def _bundle_root() -> str:
+    bundle_root = tempfile.mkdtemp(prefix='emr-launch-bytecode-')
+    atexit.register(shutil.rmtree, bundle_root, ignore_errors=True)
+    return bundle_root
+
+
+@functools.lru_cache(maxsize=None)
+def _bundle(path: str, runtime_name: str, image: str, install_dir: str,
+            sourceless: bool) -> Optional[Tuple[str, str]]:
+    """
+    Bundles a Lambda source tree once per synth process and returns the bundle directory and its asset hash.
+    Stacks reuse the bundle, CDK only stages the prebuilt directory.
+    """
+    # Bytecode is only usable by the interpreter version that compiled it
+    if _local_runtime_name() == runtime_name:
+        bundler = 'local'
+    elif _docker_available():
+        bundler = 'docker'
+    else:
+        logger.warning('Skipping bytecode compilation of %s: %s and Docker are not available', path, runtime_name)
+        return None
+
+    # Local and Docker builds can differ in the interpreter patch release, so they don't share a hash
+    mode = 'sourceless' if sourceless else 'unchecked-hash'
+    asset_hash = hashlib.sha256(
+        f'{core.FileSystem.fingerprint(path)}:{runtime_name}:{mode}:{install_dir}:{bundler}'.encode('utf-8')
+    ).hexdigest()
+
+    output_dir = os.path.join(_bundle_root(), asset_hash)
+    shutil.rmtree(output_dir, ignore_errors=True)
+    os.makedirs(output_dir)
+    if bundler == 'local':
+        _compile_local(path, output_dir, install_dir, sourceless)
+    elif not _compile_docker(path, output_dir, image, install_dir, sourceless):
+        logger.warning('Skipping bytecode compilation of %s: bundling in %s failed', path, image)
+        return None
+    return output_dir, asset_hash
+
+
+def _bytecode_asset(scope: core.Construct, path: str, runtime: aws_lambda.Runtime = LAMBDA_RUNTIME,
+                    install_dir: str = FUNCTION_INSTALL_DIR, sourceless: bool = False) -> aws_lambda.AssetCode:
+    if not _precompile_enabled(scope):
+        return aws_lambda.Code.from_asset(path)
+
+    bundle = _bundle(os.path.abspath(path), runtime.name, runtime.bundling_docker_image.image, install_dir, sourceless)
+    if bundle is None:
+        return aws_lambda.Code.from_asset(path)
+
+    bundle_dir, asset_hash = bundle
+    return aws_lambda.Code.from_asset(bundle_dir, asset_hash_type=core.AssetHashType.CUSTOM, asset_hash=asset_hash)
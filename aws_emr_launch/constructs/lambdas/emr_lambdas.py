@@ -4,13 +4,47 @@ from aws_cdk import aws_lambda, core
 
 from aws_emr_launch.constructs.base import BaseBuilder
 from aws_emr_launch.constructs.iam_roles import emr_roles
-from aws_emr_launch.constructs.lambdas import _lambda_path
+from aws_emr_launch.constructs.lambdas import LAMBDA_RUNTIME, _lambda_path
+from aws_emr_launch.constructs.lambdas.bundling import (LAYER_INSTALL_DIR,
+                                                        _bytecode_asset)
+
+# Statements without Stack specific resources are shared by every Function that uses them
+_POLICY_STATEMENTS = {
+    'ListClusters': iam.PolicyStatement(
+        effect=iam.Effect.ALLOW,
+        actions=['elasticmapreduce:ListClusters'],
+        resources=['*']
+    ),
+    'RunJobFlow': iam.PolicyStatement(
+        effect=iam.Effect.ALLOW,
+        actions=['elasticmapreduce:RunJobFlow'],
+        resources=['*']
+    ),
+    'DescribeCluster': iam.PolicyStatement(
+        effect=iam.Effect.ALLOW,
+        actions=['elasticmapreduce:DescribeCluster'],
+        resources=['*']
+    ),
+    'SendTaskSuccess': iam.PolicyStatement(
+        effect=iam.Effect.ALLOW,
+        actions=['states:SendTaskSuccess'],
+        resources=['*']
+    ),
+    'SendTaskStatus': iam.PolicyStatement(
+        effect=iam.Effect.ALLOW,
+        actions=[
+            'states:SendTaskSuccess',
+            'states:SendTaskHeartbeat',
+            'states:SendTaskFailure'
+        ],
+        resources=['*']
+    )
+}
 
 
 class FailIfClusterRunningBuilder(BaseBuilder):
     @staticmethod
     def get_or_build(scope: core.Construct) -> aws_lambda.Function:
-        code = aws_lambda.Code.from_asset(_lambda_path('emr_utilities/fail_if_cluster_running'))
         stack = core.Stack.of(scope)
 
         layer = EMRConfigUtilsLayerBuilder.get_or_build(scope)
@@ -20,19 +54,13 @@ class FailIfClusterRunningBuilder(BaseBuilder):
             lambda_function = aws_lambda.Function(
                 stack,
                 'FailIfClusterRunning',
-                code=code,
+                code=_bytecode_asset(scope, _lambda_path('emr_utilities/fail_if_cluster_running')),
                 handler='lambda_source.handler',
-                runtime=aws_lambda.Runtime.PYTHON_3_7,
+                runtime=LAMBDA_RUNTIME,
                 timeout=core.Duration.minutes(1),
                 layers=[layer],
                 initial_policy=[
-                    iam.PolicyStatement(
-                        effect=iam.Effect.ALLOW,
-                        actions=[
-                            'elasticmapreduce:ListClusters'
-                        ],
-                        resources=['*']
-                    )
+                    _POLICY_STATEMENTS['ListClusters']
                 ]
             )
             BaseBuilder.tag_construct(lambda_function)
@@ -43,7 +71,6 @@ class LoadClusterConfigurationBuilder(BaseBuilder):
     @staticmethod
     def build(scope: core.Construct, profile_namespace: str, profile_name: str,
               configuration_namespace: str, configuration_name: str) -> aws_lambda.Function:
-        code = aws_lambda.Code.from_asset(_lambda_path('emr_utilities/load_cluster_configuration'))
         stack = core.Stack.of(scope)
 
         layer = EMRConfigUtilsLayerBuilder.get_or_build(scope)
@@ -51,9 +78,9 @@ class LoadClusterConfigurationBuilder(BaseBuilder):
         lambda_function = aws_lambda.Function(
             scope,
             'LoadClusterConfiguration',
-            code=code,
+            code=_bytecode_asset(scope, _lambda_path('emr_utilities/load_cluster_configuration')),
             handler='lambda_source.handler',
-            runtime=aws_lambda.Runtime.PYTHON_3_7,
+            runtime=LAMBDA_RUNTIME,
             timeout=core.Duration.minutes(1),
             layers=[layer],
             initial_policy=[
@@ -84,7 +111,6 @@ class LoadClusterConfigurationBuilder(BaseBuilder):
 class OverrideClusterConfigsBuilder(BaseBuilder):
     @staticmethod
     def get_or_build(scope: core.Construct) -> aws_lambda.Function:
-        code = aws_lambda.Code.from_asset(_lambda_path('emr_utilities/override_cluster_configs'))
         stack = core.Stack.of(scope)
 
         layer = EMRConfigUtilsLayerBuilder.get_or_build(scope)
@@ -94,9 +120,9 @@ class OverrideClusterConfigsBuilder(BaseBuilder):
             lambda_function = aws_lambda.Function(
                 stack,
                 'OverrideClusterConfigs',
-                code=code,
+                code=_bytecode_asset(scope, _lambda_path('emr_utilities/override_cluster_configs')),
                 handler='lambda_source.handler',
-                runtime=aws_lambda.Runtime.PYTHON_3_7,
+                runtime=LAMBDA_RUNTIME,
                 timeout=core.Duration.minutes(1),
                 layers=[layer]
             )
@@ -107,7 +133,6 @@ class OverrideClusterConfigsBuilder(BaseBuilder):
 class UpdateClusterTagsBuilder(BaseBuilder):
     @staticmethod
     def get_or_build(scope: core.Construct) -> aws_lambda.Function:
-        code = aws_lambda.Code.from_asset(_lambda_path('emr_utilities/update_cluster_tags'))
         stack = core.Stack.of(scope)
 
         layer = EMRConfigUtilsLayerBuilder.get_or_build(scope)
@@ -117,9 +142,9 @@ class UpdateClusterTagsBuilder(BaseBuilder):
             lambda_function = aws_lambda.Function(
                 stack,
                 'UpdateClusterTags',
-                code=code,
+                code=_bytecode_asset(scope, _lambda_path('emr_utilities/update_cluster_tags')),
                 handler='lambda_source.handler',
-                runtime=aws_lambda.Runtime.PYTHON_3_7,
+                runtime=LAMBDA_RUNTIME,
                 timeout=core.Duration.minutes(1),
                 layers=[layer]
             )
@@ -130,7 +155,6 @@ class UpdateClusterTagsBuilder(BaseBuilder):
 class ParseJsonStringBuilder(BaseBuilder):
     @staticmethod
     def get_or_build(scope: core.Construct) -> aws_lambda.Function:
-        code = aws_lambda.Code.from_asset(_lambda_path('emr_utilities/parse_json_string'))
         stack = core.Stack.of(scope)
 
         layer = EMRConfigUtilsLayerBuilder.get_or_build(scope)
@@ -140,9 +164,9 @@ class ParseJsonStringBuilder(BaseBuilder):
             lambda_function = aws_lambda.Function(
                 stack,
                 'ParseJsonString',
-                code=code,
+                code=_bytecode_asset(scope, _lambda_path('emr_utilities/parse_json_string')),
                 handler='lambda_source.handler',
-                runtime=aws_lambda.Runtime.PYTHON_3_7,
+                runtime=LAMBDA_RUNTIME,
                 timeout=core.Duration.minutes(1),
                 layers=[layer]
             )
@@ -153,7 +177,6 @@ class ParseJsonStringBuilder(BaseBuilder):
 class OverrideStepArgsBuilder(BaseBuilder):
     @staticmethod
     def get_or_build(scope: core.Construct) -> aws_lambda.Function:
-        code = aws_lambda.Code.from_asset(_lambda_path('emr_utilities/override_step_args'))
         stack = core.Stack.of(scope)
 
         layer = EMRConfigUtilsLayerBuilder.get_or_build(scope)
@@ -163,9 +186,9 @@ class OverrideStepArgsBuilder(BaseBuilder):
             lambda_function = aws_lambda.Function(
                 stack,
                 'OverrideStepArgs',
-                code=code,
+                code=_bytecode_asset(scope, _lambda_path('emr_utilities/override_step_args')),
                 handler='lambda_source.handler',
-                runtime=aws_lambda.Runtime.PYTHON_3_7,
+                runtime=LAMBDA_RUNTIME,
                 timeout=core.Duration.minutes(1),
                 layers=[layer]
             )
@@ -176,7 +199,6 @@ class OverrideStepArgsBuilder(BaseBuilder):
 class RunJobFlowBuilder(BaseBuilder):
     @staticmethod
     def get_or_build(scope: core.Construct, roles: emr_roles.EMRRoles, event_rule: events.Rule) -> aws_lambda.Function:
-        code = aws_lambda.Code.from_asset(_lambda_path('emr_utilities/run_job_flow'))
         stack = core.Stack.of(scope)
 
         layer = EMRConfigUtilsLayerBuilder.get_or_build(scope)
@@ -186,17 +208,13 @@ class RunJobFlowBuilder(BaseBuilder):
             lambda_function = aws_lambda.Function(
                 stack,
                 'RunJobFlow',
-                code=code,
+                code=_bytecode_asset(scope, _lambda_path('emr_utilities/run_job_flow')),
                 handler='lambda_source.handler',
-                runtime=aws_lambda.Runtime.PYTHON_3_7,
+                runtime=LAMBDA_RUNTIME,
                 timeout=core.Duration.minutes(1),
                 layers=[layer],
                 initial_policy=[
-                    iam.PolicyStatement(
-                        effect=iam.Effect.ALLOW,
-                        actions=['elasticmapreduce:RunJobFlow'],
-                        resources=['*']
-                    ),
+                    _POLICY_STATEMENTS['RunJobFlow'],
                     iam.PolicyStatement(
                         effect=iam.Effect.ALLOW,
                         actions=['iam:PassRole'],
@@ -206,11 +224,7 @@ class RunJobFlowBuilder(BaseBuilder):
                             roles.autoscaling_role.role_arn
                         ]
                     ),
-                    iam.PolicyStatement(
-                        effect=iam.Effect.ALLOW,
-                        actions=['states:SendTaskSuccess'],
-                        resources=['*']
-                    ),
+                    _POLICY_STATEMENTS['SendTaskSuccess'],
                     iam.PolicyStatement(
                         effect=iam.Effect.ALLOW,
                         actions=['events:EnableRule', 'events:PutTargets'],
@@ -225,7 +239,6 @@ class RunJobFlowBuilder(BaseBuilder):
 class CheckClusterStatusBuilder(BaseBuilder):
     @staticmethod
     def get_or_build(scope: core.Construct, event_rule: events.Rule) -> aws_lambda.Function:
-        code = aws_lambda.Code.from_asset(_lambda_path('emr_utilities/check_cluster_status'))
         stack = core.Stack.of(scope)
 
         layer = EMRConfigUtilsLayerBuilder.get_or_build(scope)
@@ -235,26 +248,14 @@ class CheckClusterStatusBuilder(BaseBuilder):
             lambda_function = aws_lambda.Function(
                 stack,
                 'CheckClusterStatus',
-                code=code,
+                code=_bytecode_asset(scope, _lambda_path('emr_utilities/check_cluster_status')),
                 handler='lambda_source.handler',
-                runtime=aws_lambda.Runtime.PYTHON_3_7,
+                runtime=LAMBDA_RUNTIME,
                 timeout=core.Duration.minutes(1),
                 layers=[layer],
                 initial_policy=[
-                    iam.PolicyStatement(
-                        effect=iam.Effect.ALLOW,
-                        actions=[
-                            'states:SendTaskSuccess',
-                            'states:SendTaskHeartbeat',
-                            'states:SendTaskFailure'
-                        ],
-                        resources=['*']
-                    ),
-                    iam.PolicyStatement(
-                        effect=iam.Effect.ALLOW,
-                        actions=['elasticmapreduce:DescribeCluster'],
-                        resources=['*']
-                    ),
+                    _POLICY_STATEMENTS['SendTaskStatus'],
+                    _POLICY_STATEMENTS['DescribeCluster'],
                     iam.PolicyStatement(
                         effect=iam.Effect.ALLOW,
                         actions=[
@@ -278,7 +279,6 @@ class CheckClusterStatusBuilder(BaseBuilder):
 class EMRConfigUtilsLayerBuilder(BaseBuilder):
     @staticmethod
     def get_or_build(scope: core.Construct) -> aws_lambda.LayerVersion:
-        code = aws_lambda.Code.from_asset(_lambda_path('layers/emr_config_utils'))
         stack = core.Stack.of(scope)
 
         layer = stack.node.try_find_child('EMRConfigUtilsLayer')
@@ -287,9 +287,10 @@ class EMRConfigUtilsLayerBuilder(BaseBuilder):
                 stack,
                 'EMRConfigUtilsLayer',
                 layer_version_name='EMRLaunch_EMRUtilities_EMRConfigUtilsLayer',
-                code=code,
+                code=_bytecode_asset(scope, _lambda_path('layers/emr_config_utils'),
+                                     install_dir=LAYER_INSTALL_DIR, sourceless=True),
                 compatible_runtimes=[
-                    aws_lambda.Runtime.PYTHON_3_7
+                    LAMBDA_RUNTIME
                 ],
                 description='EMR configuration utility functions'
             )
@@ -2,8 +2,20 @@ from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda, core
 
 from aws_emr_launch import __package__
+from aws_emr_launch.constructs.lambdas import LAMBDA_RUNTIME
+from aws_emr_launch.constructs.lambdas.bundling import _bytecode_asset
 from aws_emr_launch.control_plane.constructs.lambdas import _lambda_path
 
+# (Function id, handler in get_list_apis, SSM action, SSM parameter path)
+_API_FUNCTIONS = (
+    ('GetProfile', 'get_profile_handler', 'ssm:GetParameter', 'emr_profiles'),
+    ('GetProfiles', 'get_profiles_handler', 'ssm:GetParametersByPath', 'emr_profiles'),
+    ('GetConfiguration', 'get_configuration_handler', 'ssm:GetParameter', 'cluster_configurations'),
+    ('GetConfigurations', 'get_configurations_handler', 'ssm:GetParametersByPath', 'cluster_configurations'),
+    ('GetFunction', 'get_function_handler', 'ssm:GetParameter', 'emr_launch_functions'),
+    ('GetFunctions', 'get_functions_handler', 'ssm:GetParametersByPath', 'emr_launch_functions'),
+)
+
 
 class Apis(core.Construct):
 
@@ -11,184 +23,54 @@ class Apis(core.Construct):
         super().__init__(scope, id)
 
         stack = core.Stack.of(scope)
-        code = aws_lambda.Code.from_asset(_lambda_path('apis'))
-
-        self._get_profile = aws_lambda.Function(
-            self,
-            'GetProfile',
-            function_name='EMRLaunch_APIs_GetProfile',
-            description=f'Version: {__package__}',
-            code=code,
-            handler='get_list_apis.get_profile_handler',
-            runtime=aws_lambda.Runtime.PYTHON_3_7,
-            timeout=core.Duration.minutes(1),
-            initial_policy=[
-                iam.PolicyStatement(
-                    effect=iam.Effect.ALLOW,
-                    actions=[
-                        'ssm:GetParameter'
-                    ],
-                    resources=[
-                        stack.format_arn(
-                            partition=stack.partition,
-                            service='ssm',
-                            resource='parameter/emr_launch/emr_profiles/*'
-                        )
-                    ]
-                )
-            ]
-        )
-
-        self._get_profiles = aws_lambda.Function(
-            self,
-            'GetProfiles',
-            function_name='EMRLaunch_APIs_GetProfiles',
-            description=f'Version: {__package__}',
-            code=code,
-            handler='get_list_apis.get_profiles_handler',
-            runtime=aws_lambda.Runtime.PYTHON_3_7,
-            timeout=core.Duration.minutes(1),
-            initial_policy=[
-                iam.PolicyStatement(
-                    effect=iam.Effect.ALLOW,
-                    actions=[
-                        'ssm:GetParametersByPath'
-                    ],
-                    resources=[
-                        stack.format_arn(
-                            partition=stack.partition,
-                            service='ssm',
-                            resource='parameter/emr_launch/emr_profiles/*'
-                        )
-                    ]
-                )
-            ]
-        )
-
-        self._get_configuration = aws_lambda.Function(
-            self,
-            'GetConfiguration',
-            function_name='EMRLaunch_APIs_GetConfiguration',
-            description=f'Version: {__package__}',
-            code=code,
-            handler='get_list_apis.get_configuration_handler',
-            runtime=aws_lambda.Runtime.PYTHON_3_7,
-            timeout=core.Duration.minutes(1),
-            initial_policy=[
-                iam.PolicyStatement(
-                    effect=iam.Effect.ALLOW,
-                    actions=[
-                        'ssm:GetParameter'
-                    ],
-                    resources=[
-                        stack.format_arn(
-                            partition=stack.partition,
-                            service='ssm',
-                            resource='parameter/emr_launch/cluster_configurations/*'
-                        )
-                    ]
-                )
-            ]
-        )
-
-        self._get_configurations = aws_lambda.Function(
-            self,
-            'GetConfigurations',
-            function_name='EMRLaunch_APIs_GetConfigurations',
-            description=f'Version: {__package__}',
-            code=code,
-            handler='get_list_apis.get_configurations_handler',
-            runtime=aws_lambda.Runtime.PYTHON_3_7,
-            timeout=core.Duration.minutes(1),
-            initial_policy=[
-                iam.PolicyStatement(
-                    effect=iam.Effect.ALLOW,
-                    actions=[
-                        'ssm:GetParametersByPath'
-                    ],
-                    resources=[
-                        stack.format_arn(
-                            partition=stack.partition,
-                            service='ssm',
-                            resource='parameter/emr_launch/cluster_configurations/*'
-                        )
-                    ]
-                )
-            ]
-        )
-
-        self._get_function = aws_lambda.Function(
-            self,
-            'GetFunction',
-            function_name='EMRLaunch_APIs_GetFunction',
-            description=f'Version: {__package__}',
-            code=code,
-            handler='get_list_apis.get_function_handler',
-            runtime=aws_lambda.Runtime.PYTHON_3_7,
-            timeout=core.Duration.minutes(1),
-            initial_policy=[
-                iam.PolicyStatement(
-                    effect=iam.Effect.ALLOW,
-                    actions=[
-                        'ssm:GetParameter'
-                    ],
-                    resources=[
-                        stack.format_arn(
-                            partition=stack.partition,
-                            service='ssm',
-                            resource='parameter/emr_launch/emr_launch_functions/*'
-                        )
-                    ]
-                )
-            ]
-        )
-
-        self._get_functions = aws_lambda.Function(
-            self,
-            'GetFunctions',
-            function_name='EMRLaunch_APIs_GetFunctions',
-            description=f'Version: {__package__}',
-            code=code,
-            handler='get_list_apis.get_functions_handler',
-            runtime=aws_lambda.Runtime.PYTHON_3_7,
-            timeout=core.Duration.minutes(1),
-            initial_policy=[
-                iam.PolicyStatement(
-                    effect=iam.Effect.ALLOW,
-                    actions=[
-                        'ssm:GetParametersByPath'
-                    ],
-                    resources=[
-                        stack.format_arn(
-                            partition=stack.partition,
-                            service='ssm',
-                            resource='parameter/emr_launch/emr_launch_functions/*'
-                        )
-                    ]
-                )
-            ]
-        )
+        code = _bytecode_asset(self, _lambda_path('apis'))
+
+        self._functions = {}
+        for function_id, handler, action, parameter_path in _API_FUNCTIONS:
+            self._functions[function_id] = aws_lambda.Function(
+                self,
+                function_id,
+                function_name=f'EMRLaunch_APIs_{function_id}',
+                description=f'Version: {__package__}',
+                code=code,
+                handler=f'get_list_apis.{handler}',
+                runtime=LAMBDA_RUNTIME,
+                timeout=core.Duration.minutes(1),
+                initial_policy=[
+                    iam.PolicyStatement(
+                        effect=iam.Effect.ALLOW,
+                        actions=[action],
+                        resources=[
+                            stack.format_arn(
+                                partition=stack.partition,
+                                service='ssm',
+                                resource=f'parameter/emr_launch/{parameter_path}/*'
+                            )
+                        ]
+                    )
+                ]
+            )
 
     @property
     def get_profile(self) -> aws_lambda.Function:
-        return self._get_profile
+        return self._functions['GetProfile']
 
     @property
     def get_profiles(self) -> aws_lambda.Function:
-        return self._get_profiles
+        return self._functions['GetProfiles']
 
     @property
     def get_configuration(self) -> aws_lambda.Function:
-        return self._get_configuration
+        return self._functions['GetConfiguration']
 
     @property
     def get_configurations(self) -> aws_lambda.Function:
-        return self._get_configurations
+        return self._functions['GetConfigurations']
 
     @property
     def get_function(self) -> aws_lambda.Function:
-        return self._get_function
+        return self._functions['GetFunction']
 
     @property
     def get_functions(self) -> aws_lambda.Function:
-        return self._get_functions
+        return self._functions['GetFunctions']
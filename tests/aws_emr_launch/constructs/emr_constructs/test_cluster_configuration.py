@@ -1,4 +1,5 @@
 import copy
+import json
 
 from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_s3 as s3
@@ -141,3 +142,46 @@ def test_bootstrap_action_config():
     print(config)
     print(resolved_config)
     assert resolved_config == config
+
+
+def test_update_configurations_copies_properties():
+    spark_defaults = {'spark.executor.memory': '4g'}
+    configurations_a = [{'Classification': 'spark-defaults', 'Properties': spark_defaults}]
+    configurations_b = [{'Classification': 'spark-defaults', 'Properties': spark_defaults}]
+
+    configurations_a = cluster_configuration.ClusterConfiguration.update_configurations(
+        configurations_a, 'spark-defaults', {'spark.jars.packages': 'foo'})
+
+    assert configurations_a[0]['Properties'] == {'spark.executor.memory': '4g', 'spark.jars.packages': 'foo'}
+    assert spark_defaults == {'spark.executor.memory': '4g'}
+    assert configurations_b[0]['Properties'] == {'spark.executor.memory': '4g'}
+
+
+def test_ssm_parameter_value():
+    ssm_app = core.App()
+    ssm_stack = core.Stack(ssm_app, 'test-ssm-stack')
+    cluster_config = cluster_configuration.ClusterConfiguration(
+        ssm_stack, 'test-ssm-config',
+        configuration_name='test-cluster')
+
+    # Updates made after construction are included in the stored configuration
+    cluster_config.add_spark_package('test-package')
+    cluster_config.config['Tags'].append({'Key': 'test-key', 'Value': 'test-value'})
+
+    config = copy.deepcopy(default_config)
+    config['ClusterConfiguration']['Configurations'].append({
+        'Classification': 'spark-defaults',
+        'Properties': {'spark.jars.packages': 'test-package'}
+    })
+    config['ClusterConfiguration']['Tags'] = [{'Key': 'test-key', 'Value': 'test-value'}]
+
+    template = ssm_app.synth().get_stack_by_name('test-ssm-stack').template
+    ssm_parameters = [r for r in template['Resources'].values() if r['Type'] == 'AWS::SSM::Parameter']
+    assert len(ssm_parameters) == 1
+
+    value = ssm_parameters[0]['Properties']['Value']
+    print(config)
+    print(value)
+    # Resolved like the other tests, which drops the None values the stored JSON keeps
+    assert ssm_stack.resolve(json.loads(value)) == config
+    assert value == json.dumps(json.loads(value), separators=(',', ':'))
@@ -0,0 +1,59 @@
+import gc
+import os
+
+from aws_cdk import aws_s3 as s3
+from aws_cdk import core
+
+from aws_emr_launch.constructs.emr_constructs import emr_code
+
+
+def _bucket_deployments(assembly, stack_name):
+    resources = assembly.get_stack_by_name(stack_name).template.get('Resources', {})
+    return [r for r in resources.values() if r['Type'] == 'Custom::CDKBucketDeployment']
+
+
+def test_from_path_in_one_stack(tmp_path):
+    (tmp_path / 'step.py').write_text('print("step")\n')
+
+    app = core.App()
+    stack = core.Stack(app, 'test-stack')
+    bucket = s3.Bucket(stack, 'test-bucket')
+
+    emr_code.EMRStep('Step1', 'command-runner.jar',
+                     code=emr_code.Code.from_path(str(tmp_path), bucket, 'steps')).resolve(stack)
+    # The first EMRCode is no longer referenced, the deployment is still shared
+    gc.collect()
+    emr_code.EMRStep('Step2', 'command-runner.jar',
+                     code=emr_code.Code.from_path(os.path.relpath(str(tmp_path)), bucket, 'steps')).resolve(
+        core.Construct(stack, 'test-nested-scope'))
+
+    assert len(_bucket_deployments(app.synth(), 'test-stack')) == 1
+
+
+def test_from_path_with_different_prefixes(tmp_path):
+    (tmp_path / 'step.py').write_text('print("step")\n')
+
+    app = core.App()
+    stack = core.Stack(app, 'test-stack')
+    bucket = s3.Bucket(stack, 'test-bucket')
+
+    for prefix in ('steps1', 'steps2'):
+        emr_code.EMRStep('Step', 'command-runner.jar',
+                         code=emr_code.Code.from_path(str(tmp_path), bucket, prefix)).resolve(stack)
+
+    assert len(_bucket_deployments(app.synth(), 'test-stack')) == 2
+
+
+def test_from_path_in_two_stacks(tmp_path):
+    (tmp_path / 'step.py').write_text('print("step")\n')
+
+    app = core.App()
+    bucket = s3.Bucket(core.Stack(app, 'test-bucket-stack'), 'test-bucket')
+    code = emr_code.Code.from_path(str(tmp_path), bucket, 'steps')
+
+    for stack_id in ('test-step-stack-b', 'test-step-stack-c'):
+        emr_code.EMRStep('Step', 'command-runner.jar', code=code).resolve(core.Stack(app, stack_id))
+
+    assembly = app.synth()
+    assert len(_bucket_deployments(assembly, 'test-step-stack-b')) == 1
+    assert len(_bucket_deployments(assembly, 'test-step-stack-c')) == 1
@@ -0,0 +1,139 @@
+import glob
+import marshal
+import os
+import sys
+from unittest import mock
+
+from aws_cdk import aws_lambda, core
+
+from aws_emr_launch.constructs.lambdas import bundling
+
+LOCAL_RUNTIME = aws_lambda.Runtime(f'python{sys.version_info.major}.{sys.version_info.minor}',
+                                   aws_lambda.RuntimeFamily.PYTHON)
+
+
+def _source_tree(path):
+    os.makedirs(os.path.join(path, 'package'))
+    with open(os.path.join(path, 'lambda_source.py'), 'w') as f:
+        f.write('def handler(event, context):\n    return event\n')
+    with open(os.path.join(path, 'package', '__init__.py'), 'w') as f:
+        f.write('VALUE = 1\n')
+    return str(path)
+
+
+def _bundled_files(output_dir):
+    return sorted(
+        os.path.relpath(os.path.join(dir_path, f), output_dir)
+        for dir_path, _, file_names in os.walk(output_dir) for f in file_names)
+
+
+def test_local_bundling_compiles_sources(tmp_path):
+    source = _source_tree(tmp_path / 'source')
+    output = tmp_path / 'output'
+    output.mkdir()
+
+    bundling._compile_local(source, str(output), bundling.FUNCTION_INSTALL_DIR, sourceless=False)
+
+    files = _bundled_files(str(output))
+    assert 'lambda_source.py' in files
+    assert os.path.join('package', '__init__.py') in files
+    assert any(f.startswith('__pycache__/lambda_source.') and f.endswith('.pyc') for f in files)
+
+
+def test_local_bundling_sourceless(tmp_path):
+    source = _source_tree(tmp_path / 'source')
+    output = tmp_path / 'output'
+    output.mkdir()
+
+    bundling._compile_local(source, str(output), bundling.LAYER_INSTALL_DIR, sourceless=True)
+
+    files = _bundled_files(str(output))
+    assert files == ['lambda_source.pyc', os.path.join('package', '__init__.pyc')]
+
+
+def test_local_bundling_uses_install_dir(tmp_path):
+    source = _source_tree(tmp_path / 'source')
+    with open(os.path.join(source, 'stale.pyc'), 'wb') as f:
+        f.write(b'stale')
+    output = tmp_path / 'output'
+    output.mkdir()
+
+    bundling._compile_local(source, str(output), bundling.FUNCTION_INSTALL_DIR, sourceless=False)
+
+    assert not os.path.exists(os.path.join(str(output), 'stale.pyc'))
+    pyc = glob.glob(os.path.join(str(output), '__pycache__', 'lambda_source.*.pyc'))[0]
+    with open(pyc, 'rb') as f:
+        code = marshal.loads(f.read()[16:])
+    assert code.co_filename == '/var/task/lambda_source.py'
+
+
+def test_bytecode_asset_is_opt_in(tmp_path):
+    source = _source_tree(tmp_path / 'source')
+
+    app = core.App(outdir=str(tmp_path / 'cdk.out'))
+    stack = core.Stack(app, 'test-bundling-stack')
+    aws_lambda.Function(
+        stack, 'TestFunction',
+        code=bundling._bytecode_asset(stack, source, runtime=LOCAL_RUNTIME),
+        handler='lambda_source.handler',
+        runtime=LOCAL_RUNTIME)
+    assembly = app.synth()
+
+    staged = [os.path.join(assembly.directory, d) for d in os.listdir(assembly.directory) if d.startswith('asset.')]
+    assert len(staged) == 1
+    assert not any(f.endswith('.pyc') for f in _bundled_files(staged[0]))
+
+
+def test_bytecode_asset_precompiles(tmp_path):
+    source = _source_tree(tmp_path / 'source')
+
+    app = core.App(outdir=str(tmp_path / 'cdk.out'), context={bundling.PRECOMPILE_CONTEXT_KEY: 'true'})
+    stack = core.Stack(app, 'test-bundling-stack')
+    aws_lambda.Function(
+        stack, 'TestFunction',
+        code=bundling._bytecode_asset(stack, source, runtime=LOCAL_RUNTIME, sourceless=True),
+        handler='lambda_source.handler',
+        runtime=LOCAL_RUNTIME)
+    assembly = app.synth()
+
+    staged = [os.path.join(assembly.directory, d) for d in os.listdir(assembly.directory) if d.startswith('asset.')]
+    assert len(staged) == 1
+    assert _bundled_files(staged[0]) == ['lambda_source.pyc', os.path.join('package', '__init__.pyc')]
+
+
+def test_bytecode_asset_hash_includes_compile_mode(tmp_path):
+    source = _source_tree(tmp_path / 'source')
+
+    app = core.App(outdir=str(tmp_path / 'cdk.out'), context={bundling.PRECOMPILE_CONTEXT_KEY: 'true'})
+    stack = core.Stack(app, 'test-bundling-stack')
+    for id, sourceless in (('TestFunction', False), ('TestSourcelessFunction', True)):
+        aws_lambda.Function(
+            stack, id,
+            code=bundling._bytecode_asset(stack, source, runtime=LOCAL_RUNTIME, sourceless=sourceless),
+            handler='lambda_source.handler',
+            runtime=LOCAL_RUNTIME)
+    assembly = app.synth()
+
+    staged = [d for d in os.listdir(assembly.directory) if d.startswith('asset.')]
+    assert len(staged) == 2
+    assert f'asset.{core.FileSystem.fingerprint(source)}' not in staged
+
+
+def test_bytecode_asset_bundles_once(tmp_path):
+    source = _source_tree(tmp_path / 'source')
+
+    app = core.App(outdir=str(tmp_path / 'cdk.out'), context={bundling.PRECOMPILE_CONTEXT_KEY: 'true'})
+    with mock.patch.object(bundling, '_compile_local', wraps=bundling._compile_local) as compile_local:
+        for stack_id in ('test-bundling-stack-a', 'test-bundling-stack-b'):
+            stack = core.Stack(app, stack_id)
+            for id in ('TestFunction1', 'TestFunction2'):
+                aws_lambda.Function(
+                    stack, id,
+                    code=bundling._bytecode_asset(stack, source, runtime=LOCAL_RUNTIME),
+                    handler='lambda_source.handler',
+                    runtime=LOCAL_RUNTIME)
+        assembly = app.synth()
+
+    assert compile_local.call_count == 1
+    staged = [d for d in os.listdir(assembly.directory) if d.startswith('asset.')]
+    assert len(staged) == 1
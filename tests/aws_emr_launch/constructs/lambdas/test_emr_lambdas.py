@@ -0,0 +1,18 @@
+from unittest import mock
+
+from aws_cdk import core
+
+from aws_emr_launch.constructs.lambdas import bundling, emr_lambdas
+
+
+def test_emr_config_utils_layer_is_sourceless():
+    stack = core.Stack(core.App(), 'test-lambdas-stack')
+
+    with mock.patch.object(emr_lambdas, '_bytecode_asset', wraps=emr_lambdas._bytecode_asset) as bytecode_asset:
+        layer = emr_lambdas.EMRConfigUtilsLayerBuilder.get_or_build(stack)
+        assert emr_lambdas.EMRConfigUtilsLayerBuilder.get_or_build(stack) is layer
+
+    bytecode_asset.assert_called_once()
+    _, kwargs = bytecode_asset.call_args
+    assert kwargs['sourceless'] is True
+    assert kwargs['install_dir'] == bundling.LAYER_INSTALL_DIR
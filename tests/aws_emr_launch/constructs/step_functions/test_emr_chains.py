@@ -252,3 +252,21 @@ def test_add_step_with_argument_overrides():
     )
 
     print_and_assert(default_fragment_json, fragment)
+
+
+def test_add_step_with_argument_overrides_without_args():
+    stack = core.Stack(core.App(), 'test-stack')
+    emr_step = emr_code.EMRStep('test-step', 'Jar', 'Main')
+
+    fragment = emr_chains.AddStepWithArgumentOverrides(
+        stack, 'test-fragment',
+        emr_step=emr_step,
+        cluster_id='test-cluster-id'
+    )
+
+    resolved_fragment = stack.resolve(fragment.to_single_state().to_state_json())
+    states = resolved_fragment['Branches'][0]['States']
+    assert states['test-fragment: test-step - Override Args']['Parameters']['Args'] == []
+    assert states['test-fragment: test-step']['Parameters']['Step']['HadoopJarStep']['Args.$'] == \
+        '$.test-fragmentResultArgs'
+    assert emr_step.resolve(stack)['HadoopJarStep']['Args'] == []